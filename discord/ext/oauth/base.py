@@ -0,0 +1,26 @@
+__all__: tuple = (
+    "DiscordObject",
+)
+
+
+class DiscordObject:
+    __slots__ = ("_data", "id")
+
+    def __init__(self, data):
+        self._data = data
+        self.id = data['id']
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return self.id >> 22
+
+    @property
+    def json(self) -> dict:
+        """The original JSON data for this model."""
+        return self._data
@@ -1,6 +1,10 @@
+from __future__ import annotations
+
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Union
+from urllib.parse import quote
 
-from .http import HTTPClient, Route
+from .http import HTTPClient, _ROUTE_GUILDS, _ROUTE_ME, _ROUTE_TOKEN
 from .models import User, TokenResponse
 
 __all__: tuple = ("OAuth2Client",)
@@ -13,6 +17,9 @@ DISCORD_URL = "https://discord.com"
 class OAuth2Client:
     """
     A class representing a client interacting with the discord OAuth2 API.
+
+    All requests made by a client share a single keep-alive HTTP session. The client
+    can be used as an async context manager to close that session on exit.
     """
 
     def __init__(
@@ -39,6 +46,17 @@ class OAuth2Client:
         self._redirect = redirect_uri
         self._scopes = " ".join(scopes) if scopes is not None else None
 
+        # the authorize url only varies by state/prompt, so build the rest once
+        redirect_enc = quote(redirect_uri, safe="")
+        scopes_enc = quote(self._scopes, safe="") if self._scopes is not None else ""
+        self._auth_prefix: str = (
+            f"{DISCORD_URL}/api/oauth2/authorize?client_id={self._id}"
+            f"&redirect_uri={redirect_enc}&scope={scopes_enc}&response_type=code"
+        )
+
+        # read-only credentials every token grant request starts from
+        self._token_base = MappingProxyType({"client_id": self._id, "client_secret": self._auth})
+
         self.http = HTTPClient()
         self.http._state_info.update(
             {
@@ -50,20 +68,19 @@ class OAuth2Client:
         )
 
     def auth(self, state: Optional[str] = None, prompt: Optional[str] = None):
-        client_id = f"client_id={self._id}"
-        redirect_uri = f"redirect_uri={self._redirect}"
-        scopes = f"scope={self._scopes}"
-        response_type = "response_type=code"
-        url = (
-            DISCORD_URL
-            + f"/api/oauth2/authorize?{client_id}&{redirect_uri}&{scopes}&{response_type}"
-        )
+        url = self._auth_prefix
         if state:
-            url += f"&state={state}"
+            url = f"{url}&state={state}"
         if prompt:
-            url += f"&prompt={prompt}"
+            url = f"{url}&prompt={prompt}"
         return url
 
+    async def __aenter__(self) -> OAuth2Client:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
     async def exchange_code(self, code: str) -> TokenResponse:
         """Exchanges the code you receive from the OAuth2 redirect.
 
@@ -72,17 +89,15 @@ class OAuth2Client:
         :return: A response class containing information about the access token
         :rtype: AccessTokenResponse
         """
-        route = Route("POST", "/oauth2/token")
         post_data = {
-            "client_id": self._id,
-            "client_secret": self._auth,
+            **self._token_base,
             "grant_type": "authorization_code",
             "code": code,
             "redirect_uri": self._redirect,
         }
         if self._scopes is not None:
             post_data["scope"] = self._scopes
-        resp = await self.http.request(route, data=post_data)
+        resp = await self.http.request(_ROUTE_TOKEN, data=post_data)
         token_resp = TokenResponse(data=resp)
         return token_resp
 
@@ -96,42 +111,48 @@ class OAuth2Client:
         :return: A new access token response containg information about the refreshed access token
         :rtype: Dict[str, Any]
         """
-        route = Route("POST", "/oauth2/token")
         post_data = {
-            "client_id": self._id,
-            "client_secret": self._auth,
+            **self._token_base,
             "grant_type": "refresh_token",
             "refresh_token": refresh_token,
         }
-        return await self.http.request(route, data=post_data)
+        return await self.http.request(_ROUTE_TOKEN, data=post_data)
 
     async def identify(
-        self, token: Union[Dict[str, Any], TokenResponse]
+        self, token: Union[str, Dict[str, Any], TokenResponse]
     ) -> User:
         """Makes an api call to fetch a user using their access token.
 
-        :param access_token_response: A class holding information about an access token
-        :type access_token_response: AccessTokenResponse
+        :param token: The access token, either as a raw string, the token response dict or a TokenResponse
+        :type token: Union[str, Dict[str, Any], TokenResponse]
         :return: Returns a User object holding information about the select user
         :rtype: User
         """
-        if not isinstance(token, TokenResponse):
-            token = TokenResponse(data=token)
-
-        access_token = token.access_token
-
-        route = Route("GET", "/users/@me")
-        headers = {"Authorization": "Bearer {}".format(access_token)}
-        resp = await self.http.request(route, headers=headers)
-        user = User(http=self.http, data=resp, acr=token)
+        # normalized once here; User takes the TokenResponse (or None) and access token as-is
+        if isinstance(token, TokenResponse):
+            acr = token
+        elif isinstance(token, dict):
+            acr = TokenResponse(data=token)
+        else:
+            acr = None
+        access_token = acr.access_token if acr is not None else token
+
+        headers = {"Authorization": f"Bearer {access_token}"}
+        resp = await self.http.request(_ROUTE_ME, headers=headers)
+        user = User(
+            http=self.http,
+            data=resp,
+            acr=acr,
+            token_base=self._token_base,
+            access_token=access_token,
+        )
         return user
 
     async def guilds(self, token: Dict[str, Any]) -> Dict[str, Any]:
         access_token = token["access_token"]
 
-        route = Route("GET", "/users/@me/guilds")
-        headers = {"Authorization": "Bearer {}".format(access_token)}
-        guilds = await self.http.request(route, headers=headers)
+        headers = {"Authorization": f"Bearer {access_token}"}
+        guilds = await self.http.request(_ROUTE_GUILDS, headers=headers)
         return guilds
 
     async def close(self):
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-from typing import List, TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence, Union
+
+from .base import DiscordObject
 
 if TYPE_CHECKING:
-    from .user import User
+    from .models import User
+    from .user import User as LegacyUser
 
 __all__: tuple = (
     "Guild",
 )
 
 
-class Guild:
+class Guild(DiscordObject):
     """
     A class representing a PartialGuild object sent by the OAuth2 API. This is not meant to be manually created.
 
@@ -26,19 +29,36 @@ class Guild:
         The asset url for the icon of the guild
     is_user_owner: bool
         Whether or not the user attached to this guild is the owner of the guild
-    features: List[str]
+    features: Sequence[str]
         A list of enabled guild features
     """
-    def __init__(self, *, data: dict, user: User):
+    __slots__ = (
+        "_icon_hash",
+        "_icon_format",
+        "user",
+        "name",
+        "icon_url",
+        "is_user_owner",
+        "features",
+    )
+
+    def __init__(self, *, data: dict, user: Union[User, LegacyUser]) -> None:
+        # not DiscordObject.__init__, partial guild payloads may lack an id
         self._data = data
+        self.id: int = int(data.get("id", 0))
 
-        self._icon_hash = self._data.get("icon")
-        self._icon_format = None if not self._icon_hash else "gif" if self._icon_hash.startswith("a") else "png"
+        icon_hash = data.get("icon")
+        if icon_hash:
+            icon_format = "gif" if icon_hash[0] == "a" else "png"
+            self.icon_url: Optional[str] = f"https://cdn.discordapp.com/icons/{self.id}/{icon_hash}.{icon_format}"
+        else:
+            icon_format = None
+            self.icon_url = None
+        self._icon_hash = icon_hash
+        self._icon_format = icon_format
 
         self.user = user
 
-        self.id: int = int(self._data.get("id", 0))
-        self.name: Optional[str] = self._data.get("name")
-        self.icon_url: Optional[str] = "https://cdn.discordapp.com/icons/{0.id}/{0._icon_hash}.{0._icon_format}".format(self) if self._icon_format else None
-        self.is_user_owner: Optional[bool] = self._data.get("owner")
-        self.features: Optional[List[str]] = self._data.get("features")
+        self.name: Optional[str] = data.get("name")
+        self.is_user_owner: Optional[bool] = data.get("owner")
+        self.features: Sequence[str] = data.get("features", ())
@@ -1,5 +1,10 @@
 import aiohttp
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from .errors import HTTPException
 
 
@@ -17,31 +22,38 @@ class Route:
         self.method = method
 
 
+# routes shared by the client and models, built once at import time
+_ROUTE_TOKEN = Route("POST", "/oauth2/token")
+_ROUTE_ME = Route("GET", "/users/@me")
+_ROUTE_GUILDS = Route("GET", "/users/@me/guilds")
+
+
 class HTTPClient:
     def __init__(self):
         self.__session = None  # filled in later
         self._state_info = {}  # client fills this
 
     async def _create_session(self) -> aiohttp.ClientSession:
-        self.__session = aiohttp.ClientSession()
+        # one pooled, keep-alive session per client so requests reuse the same TLS connections
+        connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=75)
+        self.__session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},  # the discord OAuth2 api requires this header to be set to this
+        )
         return self.__session
 
     async def request(self, route: Route, **kwargs) -> dict:
         if self.__session is None or self.__session.closed is True:
             await self._create_session()
 
-        headers = kwargs.pop("headers", {})
-
-        headers["Content-Type"] = "application/x-www-form-urlencoded"  # the discord OAuth2 api requires this header to be set to this
-        kwargs["headers"] = headers
-
         async with self.__session.request(route.method, route.url, **kwargs) as resp:
-            json = await resp.json()
+            json = await resp.json(loads=_json_loads)  # orjson when installed
             if 200 <= resp.status < 300:
                 return json
             else:
                 raise HTTPException(resp, json=json)
 
     async def close(self):
-        await self.__session.close()
+        if self.__session is not None:
+            await self.__session.close()
         self.__session = None
@@ -1,30 +1,16 @@
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any, Union
+from typing import Any, List, Mapping, Optional
 
-from .http import HTTPClient, Route
-
-
-class DiscordObject:
-    def __init__(self, data):
-        self._data = data
-        self.id = data['id']
-
-    def __eq__(self, other) -> bool:
-        return other.id == self.id
-
-    def __ne__(self, other) -> bool:
-        return not self.__eq__(other)
-
-    def __hash__(self) -> int:
-        return self.id >> 22
-
-    def json(self):
-        """Returns the original JSON data for this model."""
-        return self._data
+from .base import DiscordObject
+from .errors import ExtOauthException
+from .guild import Guild
+from .http import HTTPClient, _ROUTE_GUILDS, _ROUTE_TOKEN
 
 
 class TokenResponse(DiscordObject):
+    __slots__ = ("access_token", "token_type", "expires_in", "refresh_token", "scope")
+
     def __init__(self, *, data: dict) -> None:
         self._data = data
         self.access_token: str = self._data["access_token"]
@@ -34,61 +20,71 @@ class TokenResponse(DiscordObject):
         self.scope: str = self._data["scope"]
 
 
-class Guild(DiscordObject):
-    def __init__(self, *, data: dict, user: User) -> None:
-        self._data = data
-
-        self._icon_hash = self._data.get("icon")
-        self._icon_format = None if not self._icon_hash else "gif" if self._icon_hash.startswith("a") else "png"
-
-        self.user = user
-
-        self.id: int = self._data["id", 0]
-        self.name: str = self._data["name"]
-        self.icon_url: Optional[str] = "https://cdn.discordapp.com/icons/{0.id}/{0._icon_hash}.{0._icon_format}".format(self) if self._icon_format else None
-        self.is_user_owner: Optional[bool] = self._data.get("owner")
-        self.features: List[str] = self._data.get("features", [])
-
-
 class User(DiscordObject):
-    def __init__(self, *, http: HTTPClient, data: dict, acr: Union[Dict[str, Any], TokenResponse]):
-        self._data = data
+    __slots__ = (
+        "_http",
+        "_acr",
+        "_access_token",
+        "_auth_header",
+        "_token_base",
+        "_avatar_hash",
+        "_avatar_format",
+        "name",
+        "avatar_url",
+        "discriminator",
+        "mfa_enabled",
+        "email",
+        "verified",
+        "guilds",
+    )
+
+    def __init__(
+        self,
+        *,
+        http: HTTPClient,
+        data: dict,
+        acr: Optional[TokenResponse],
+        token_base: Mapping[str, Any],
+        access_token: Optional[str] = None,
+    ):
+        super().__init__(data)
         self._http = http
-        if isinstance(acr, TokenResponse):
-            self._acr: TokenResponse = acr
+        self._acr: Optional[TokenResponse] = acr  # None when identified with a bare access token
+        self._access_token: Optional[str] = acr.access_token if acr is not None else access_token
+        self._auth_header = {"Authorization": f"Bearer {self._access_token}"}
+        self._token_base = token_base  # the client's read-only client_id/client_secret mapping
+
+        avatar_hash = data["avatar"]
+        if avatar_hash:
+            avatar_format = "gif" if avatar_hash[0] == "a" else "png"
+            self.avatar_url: Optional[str] = f"https://cdn.discordapp.com/avatars/{self.id}/{avatar_hash}.{avatar_format}"
         else:
-            self._acr: TokenResponse = TokenResponse(data=acr)
+            avatar_format = None
+            self.avatar_url = None
+        self._avatar_hash = avatar_hash
+        self._avatar_format = avatar_format
 
-        self._avatar_hash = self._data["avatar"]
-        self._avatar_format = None if not self._avatar_hash else "gif" if self._avatar_hash.startswith("a") else "png"
-
-        self.id: int = self._data["id"]
         self.name: Optional[str] = self._data["username"]
-        self.avatar_url: Optional[str] = None if not self._avatar_hash else "https://cdn.discordapp.com/avatars/{0.id}/{0._avatar_hash}.{0._avatar_format}".format(
-            self
-        )
         self.discriminator: int = self._data["discriminator"]
         self.mfa_enabled: Optional[bool] = self._data.get("mfa_enabled")
         self.email: Optional[str] = self._data.get("email")
         self.verified: Optional[bool] = self._data.get("verified")
 
-        self.guilds: List[Guild] = []  # this is filled in when fetch_guilds is called
+        self.guilds: Optional[List[Guild]] = None  # this is filled in when fetch_guilds is called
 
     @property
     def access_token(self) -> Optional[str]:
-        return self._acr.access_token
+        return self._access_token
 
     @property
-    def refresh_token(self) -> str:
-        return self._acr.refresh_token
+    def refresh_token(self) -> Optional[str]:
+        return self._acr.refresh_token if self._acr is not None else None
 
     def __str__(self) -> str:
-        return "{0.name}#{0.discriminator}".format(self)
+        return f"{self.name}#{self.discriminator}"
 
     def __repr__(self) -> str:
-        return "<User id={0.id} name={0.name} discriminator={0.discriminator} verified={0.verified}>".format(
-            self
-        )
+        return f"<User id={self.id} name={self.name} discriminator={self.discriminator} verified={self.verified}>"
 
     async def refresh(self) -> TokenResponse:
         """Refreshes the access token for the user and returns a fresh access token response.
@@ -97,16 +93,19 @@ class User(DiscordObject):
         :rtype: AccessTokenResponse
         """
         refresh_token = self.refresh_token
-        route = Route("POST", "/oauth2/token")
+        if refresh_token is None:
+            raise ExtOauthException("This user was identified with a bare access token and has no refresh token")
+
         post_data = {
-            "client_id": self._http._state_info["client_id"],
-            "client_secret": self._http._state_info["client_secret"],
+            **self._token_base,
             "grant_type": "refresh_token",
             "refresh_token": refresh_token,
         }
-        request_data = await self._http.request(route, data=post_data)
+        request_data = await self._http.request(_ROUTE_TOKEN, data=post_data)
         token_resp = TokenResponse(data=request_data)
         self._acr = token_resp
+        self._access_token = token_resp.access_token
+        self._auth_header = {"Authorization": f"Bearer {self._access_token}"}
         return token_resp
 
     async def fetch_guilds(self, *, refresh: bool = True) -> List[Guild]:
@@ -117,15 +116,10 @@ class User(DiscordObject):
         :return: A List of Guild objects either from cache or returned from the api call
         :rtype: List[Guild]
         """
-        if not refresh and self.guilds:
+        if not refresh and self.guilds is not None:
             return self.guilds
 
-        route = Route("GET", "/users/@me/guilds")
-        headers = {"Authorization": "Bearer {}".format(self.access_token)}
-        resp = await self._http.request(route, headers=headers)
-        self.guilds = []
-        for array in resp:
-            guild = Guild(data=array, user=self)
-            self.guilds.append(guild)
+        resp = await self._http.request(_ROUTE_GUILDS, headers=self._auth_header)
+        self.guilds = [Guild(data=data, user=self) for data in resp]
 
         return self.guilds
@@ -108,7 +108,7 @@ class NoAsyncOAuth2Client:
         """
         access_token = access_token_response.token
         route = Route("GET", "/users/@me")
-        headers = {"Authorization": "Bearer {}".format(access_token)}
+        headers = {"Authorization": f"Bearer {access_token}"}
         resp = self.http.request(route, headers=headers)
         user = NoAsyncUser(http=self.http, data=resp, acr=access_token_response)
         self._user_cache.update({user.id: user})
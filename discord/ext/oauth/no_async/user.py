@@ -48,7 +48,7 @@ class NoAsyncUser(User):
             return self.guilds
 
         route = Route("GET", "/users/@me/guilds")
-        headers = {"Authorization": "Bearer {}".format(self.access_token)}
+        headers = {"Authorization": f"Bearer {self.access_token}"}
         resp = self._http.request(route, headers=headers)
         self.guilds = []
         for array in resp:
@@ -43,14 +43,19 @@ class User:
         self._http = http
         self._acr: AccessTokenResponse = acr
 
-        self._avatar_hash = self._data.get("avatar")
-        self._avatar_format = None if not self._avatar_hash else "gif" if self._avatar_hash.startswith("a") else "png"
-
         self.id: int = int(self._data.get("id", 0))
+
+        avatar_hash = self._data.get("avatar")
+        if avatar_hash:
+            avatar_format = "gif" if avatar_hash[0] == "a" else "png"
+            self.avatar_url: Optional[str] = f"https://cdn.discordapp.com/avatars/{self.id}/{avatar_hash}.{avatar_format}"
+        else:
+            avatar_format = None
+            self.avatar_url = None
+        self._avatar_hash = avatar_hash
+        self._avatar_format = avatar_format
+
         self.name: Optional[str] = self._data.get("username")
-        self.avatar_url: Optional[str] = None if not self._avatar_hash else "https://cdn.discordapp.com/avatars/{0.id}/{0._avatar_hash}.{0._avatar_format}".format(
-            self
-        )
         self.discriminator: int = int(self._data.get("discriminator", 0000))
         self.mfa_enabled: Optional[bool] = self._data.get("mfa_enabled")
         self.email: Optional[str] = self._data.get("email")
@@ -58,15 +63,13 @@ class User:
         self.access_token: Optional[str] = self._acr.token
         self.refresh_token: str = self._acr.refresh_token
 
-        self.guilds: List[Guild] = []  # this is filled in when fetch_guilds is called
+        self.guilds: Optional[List[Guild]] = None  # this is filled in when fetch_guilds is called
 
     def __str__(self) -> str:
-        return "{0.name}#{0.discriminator}".format(self)
+        return f"{self.name}#{self.discriminator}"
 
     def __repr__(self) -> str:
-        return "<User id={0.id} name={0.name} discriminator={0.discriminator} verified={0.verified}>".format(
-            self
-        )
+        return f"<User id={self.id} name={self.name} discriminator={self.discriminator} verified={self.verified}>"
 
     async def refresh(self) -> AccessTokenResponse:
         """Refreshes the access token for the user and returns a fresh access token response.
@@ -97,15 +100,12 @@ class User:
         :return: A List of Guild objects either from cache or returned from the api call
         :rtype: List[Guild]
         """
-        if not refresh and self.guilds:
+        if not refresh and self.guilds is not None:
             return self.guilds
 
         route = Route("GET", "/users/@me/guilds")
-        headers = {"Authorization": "Bearer {}".format(self.access_token)}
+        headers = {"Authorization": f"Bearer {self.access_token}"}
         resp = await self._http.request(route, headers=headers)
-        self.guilds = []
-        for array in resp:
-            guild = Guild(data=array, user=self)
-            self.guilds.append(guild)
+        self.guilds = [Guild(data=data, user=self) for data in resp]
 
         return self.guilds
@@ -7,9 +7,9 @@ with open('requirements.txt',  'r') as f:
 with open('README.md', encoding='utf-8') as f:
     readme = f.read()
 
-# speedups for aiohttp
+# speedups for aiohttp and faster response decoding
 extras_require = {
-    'speedups': 'aiohttp[speedups]',
+    'speedups': ['aiohttp[speedups]', 'orjson'],
 }
 
 setup(